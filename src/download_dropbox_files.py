@@ -2,6 +2,9 @@ import dropbox
 import os
 import requests
 import sys
+import time
+
+DELETE_BATCH_SIZE = 1000
 
 # Function to refresh the access token
 def refresh_access_token(refresh_token, client_id, client_secret):
@@ -19,15 +22,32 @@ def refresh_access_token(refresh_token, client_id, client_secret):
         print("❌ Failed to refresh access token:", response.text)
         raise Exception("Failed to refresh access token")
 
-# Function to delete a file from Dropbox
-def delete_file_from_dropbox(dbx, file_path, log_file):
+# Function to delete a batch of files from Dropbox in a single job
+def delete_files_from_dropbox(dbx, file_paths, log_file):
     try:
-        dbx.files_delete_v2(file_path)
-        log_file.write(f"Deleted file from Dropbox: {file_path}\n")
-        print(f"🗑️ Deleted from Dropbox: {file_path}")
+        launch = dbx.files_delete_batch([dropbox.files.DeleteArg(path) for path in file_paths])
+        if launch.is_async_job_id():
+            job_id = launch.get_async_job_id()
+            status = dbx.files_delete_batch_check(job_id)
+            while status.is_in_progress():
+                time.sleep(1)
+                status = dbx.files_delete_batch_check(job_id)
+        else:
+            status = launch
+
+        if not status.is_complete():
+            raise Exception(f"Batch delete did not complete: {status}")
+
+        for file_path, entry in zip(file_paths, status.get_complete().entries):
+            if entry.is_success():
+                log_file.write(f"Deleted file from Dropbox: {file_path}\n")
+                print(f"🗑️ Deleted from Dropbox: {file_path}")
+            else:
+                log_file.write(f"Failed to delete file: {file_path}, error: {entry.get_failure()}\n")
+                print(f"❌ Failed to delete {file_path}: {entry.get_failure()}")
     except Exception as e:
-        log_file.write(f"Failed to delete file: {file_path}, error: {e}\n")
-        print(f"❌ Failed to delete {file_path}: {e}")
+        log_file.write(f"Failed to delete files: {file_paths}, error: {e}\n")
+        print(f"❌ Failed to delete files: {e}")
 
 # Function to delete all files except .step and flow_data.json
 def delete_files_except_step_and_flow(dropbox_folder, refresh_token, client_id, client_secret, log_file_path):
@@ -37,12 +57,22 @@ def delete_files_except_step_and_flow(dropbox_folder, refresh_token, client_id,
     with open(log_file_path, "a") as log_file:
         log_file.write("Starting selective deletion...\n")
         try:
-            result = dbx.files_list_folder(dropbox_folder)
-            for entry in result.entries:
-                if isinstance(entry, dropbox.files.FileMetadata):
-                    name = entry.name
-                    if not (name.endswith(".step") or name == "flow_data.json"):
-                        delete_file_from_dropbox(dbx, entry.path_lower, log_file)
+            paths_to_delete = []
+            has_more = True
+            cursor = None
+            while has_more:
+                result = dbx.files_list_folder_continue(cursor) if cursor else dbx.files_list_folder(dropbox_folder)
+                for entry in result.entries:
+                    if isinstance(entry, dropbox.files.FileMetadata):
+                        name = entry.name
+                        if not (name.endswith(".step") or name == "flow_data.json"):
+                            paths_to_delete.append(entry.path_lower)
+                has_more = result.has_more
+                cursor = result.cursor
+
+            # Dropbox accepts at most DELETE_BATCH_SIZE entries per batch job
+            for i in range(0, len(paths_to_delete), DELETE_BATCH_SIZE):
+                delete_files_from_dropbox(dbx, paths_to_delete[i:i + DELETE_BATCH_SIZE], log_file)
             log_file.write("Selective deletion completed.\n")
         except Exception as e:
             log_file.write(f"Error during deletion: {e}\n")
@@ -65,9 +95,8 @@ def download_files_from_dropbox(dropbox_folder, local_folder, refresh_token, cli
                 for entry in result.entries:
                     if isinstance(entry, dropbox.files.FileMetadata):
                         local_path = os.path.join(local_folder, entry.name)
-                        with open(local_path, "wb") as f:
-                            metadata, res = dbx.files_download(path=entry.path_lower)
-                            f.write(res.content)
+                        # Stream straight to disk instead of buffering the whole file in memory
+                        dbx.files_download_to_file(local_path, entry.path_lower)
                         log_file.write(f"Downloaded {entry.name} to {local_path}\n")
                         print(f"📥 Downloaded: {entry.name}")
                 has_more = result.has_more
@@ -9,15 +9,16 @@ FLOW_DATA_FILE = os.path.join(INPUT_DIR, "flow_data.json")
 ADVICE_FILE = os.path.join(INPUT_DIR, "geometry_resolution_advice.json")
 MAX_VOXELS = 10_000_000
 NUM_STEPS = 10
+REQUIRED_FLOW_BLOCKS = frozenset(("simulation_parameters", "model_properties"))
 
 def compute_resolution_sweep(json_path):
     print(f"🔍 Reading enriched metadata from: {json_path}")
-    if not os.path.isfile(json_path):
+    try:
+        with open(json_path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
         raise FileNotFoundError(f"❌ File not found: {json_path}")
 
-    with open(json_path, "r") as f:
-        data = json.load(f)
-
     domain = data["domain_definition"]
     min_x = domain["min_x"]
     max_x = domain["max_x"]
@@ -85,21 +86,16 @@ def update_flow_data(current_resolution):
     print(f"🔧 Updating flow_data.json with:")
     print(f"    default_resolution = {current_resolution}")
 
-    if not os.path.isfile(FLOW_DATA_FILE):
+    try:
+        with open(FLOW_DATA_FILE, "r") as f:
+            flow_data = json.load(f)
+    except FileNotFoundError:
         raise FileNotFoundError(f"❌ flow_data.json not found at: {FLOW_DATA_FILE}")
 
-    with open(FLOW_DATA_FILE, "r") as f:
-        flow_data = json.load(f)
-
-    if "simulation_parameters" not in flow_data:
-        raise KeyError("❌ 'simulation_parameters' block missing in flow_data.json")
-    if "model_properties" not in flow_data:
-        raise KeyError("❌ 'model_properties' block missing in flow_data.json")
-
-    # Read resolution_runs_array again to get output_interval
-    with open(ADVICE_FILE, "r") as f:
-        advice = json.load(f)
-    sweep_array = advice["resolution_runs_array"]
+    missing_blocks = REQUIRED_FLOW_BLOCKS - flow_data.keys()
+    if missing_blocks:
+        missing = ", ".join(f"'{block}'" for block in sorted(missing_blocks))
+        raise KeyError(f"❌ {missing} block(s) missing in flow_data.json")
 
     flow_data["model_properties"]["default_resolution"] = current_resolution
 
@@ -3,6 +3,9 @@ import os
 import requests
 import sys
 
+# Files larger than this are uploaded in chunks of this size (must be a multiple of 4 MB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 # Function to refresh the access token
 def refresh_access_token(refresh_token, client_id, client_secret):
     """Refreshes the Dropbox access token using the refresh token."""
@@ -28,10 +31,22 @@ def upload_file_to_dropbox(local_file_path, dropbox_file_path, refresh_token, cl
         access_token = refresh_access_token(refresh_token, client_id, client_secret)
         dbx = dropbox.Dropbox(access_token)
 
+        file_size = os.path.getsize(local_file_path)
+
         # Open the local file in binary read mode
         with open(local_file_path, "rb") as f:
-            # Upload the file, overwriting if it already exists
-            dbx.files_upload(f.read(), dropbox_file_path, mode=dropbox.files.WriteMode.overwrite)
+            if file_size <= UPLOAD_CHUNK_SIZE:
+                # Upload the file, overwriting if it already exists
+                dbx.files_upload(f.read(), dropbox_file_path, mode=dropbox.files.WriteMode.overwrite)
+            else:
+                # Stream large files through an upload session so only one chunk is held in memory
+                session = dbx.files_upload_session_start(f.read(UPLOAD_CHUNK_SIZE))
+                cursor = dropbox.files.UploadSessionCursor(session_id=session.session_id, offset=f.tell())
+                commit = dropbox.files.CommitInfo(path=dropbox_file_path, mode=dropbox.files.WriteMode.overwrite)
+                while file_size - f.tell() > UPLOAD_CHUNK_SIZE:
+                    dbx.files_upload_session_append_v2(f.read(UPLOAD_CHUNK_SIZE), cursor)
+                    cursor.offset = f.tell()
+                dbx.files_upload_session_finish(f.read(UPLOAD_CHUNK_SIZE), cursor, commit)
         print(f"✅ Successfully uploaded file to Dropbox: {dropbox_file_path}")
         return True # Indicate success
     except Exception as e: